@@ -0,0 +1,108 @@
+"""Load the `.env` file for the demo app via a generated (and therefore `.pyc` cached) python module.
+
+Parsing `.env` on every process start means disk IO and line-by-line string parsing. Instead, the file is parsed
+once and the values are written to a python module as a plain dict literal. Later starts only need to import that
+module. The cache is regenerated whenever the `.env` file changes (compared by path and mtime).
+
+The cache lives in the user's cache directory (not the app directory), so it is never copied into a docker image and
+writing it doesn't trigger a `reflex run` hot reload.
+
+Note: The cache is a plaintext copy of the `.env` values, including secrets like `CLERK_SECRET_KEY`. It is written to
+`$XDG_CACHE_HOME/clerk_api_demo/` (default `~/.cache/clerk_api_demo/`) as `env_<hash>.py`, plus its `.pyc` in the
+`__pycache__` directory next to it. Nothing removes it automatically; delete that directory to remove the copies (it
+is recreated from `.env` on the next start).
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "clerk_api_demo"
+)
+
+_CACHE_TEMPLATE = """\
+# Generated by clerk_api_demo/bootstrap_env.py from {source!r} -- do not edit (contains secrets).
+SOURCE = {source!r}
+MTIME_NS = {mtime_ns!r}
+VARS = {values!r}
+"""
+
+
+def _find_dotenv() -> Path | None:
+    """Find the nearest `.env` file, searching upwards from this directory (same as `dotenv.find_dotenv`)."""
+    directory = Path(__file__).resolve().parent
+    for candidate_dir in (directory, *directory.parents):
+        candidate = candidate_dir / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _cache_path(dotenv_path: Path) -> Path:
+    """One cache module per `.env` file."""
+    digest = hashlib.sha1(str(dotenv_path).encode()).hexdigest()[:16]
+    return _CACHE_DIR / f"env_{digest}.py"
+
+
+def _read_cache(cache_path: Path) -> Any:
+    """Import the cache module (byte compiled into `__pycache__` next to it), or None if missing/broken."""
+    spec = importlib.util.spec_from_file_location("_env_cache", cache_path)
+    if spec is None or spec.loader is None or not cache_path.is_file():
+        return None
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        # A broken cache is just regenerated.
+        return None
+    return module
+
+
+def _write_cache(dotenv_path: Path, cache_path: Path, mtime_ns: int) -> dict[str, str]:
+    """Parse the `.env` file and write the values to the cache module."""
+    # Only needed when the cache is stale, so avoid importing at module level.
+    from dotenv import dotenv_values
+
+    values = {k: v for k, v in dotenv_values(dotenv_path).items() if v is not None}
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        cache_path.touch(mode=0o600)
+        cache_path.write_text(
+            _CACHE_TEMPLATE.format(
+                source=str(dotenv_path), mtime_ns=mtime_ns, values=values
+            )
+        )
+        # The `.pyc` is only invalidated by source mtime (seconds) and size, so drop it explicitly.
+        Path(importlib.util.cache_from_source(str(cache_path))).unlink(missing_ok=True)
+    except OSError as e:
+        # E.g. read-only filesystem -- still fine to use the parsed values directly.
+        logger.warning("Could not write env cache: %s", e)
+    return values
+
+
+def load_env() -> None:
+    """Load environment variables from the `.env` file (existing environment variables are not overridden)."""
+    dotenv_path = _find_dotenv()
+    if dotenv_path is None:
+        return
+    mtime_ns = dotenv_path.stat().st_mtime_ns
+    cache_path = _cache_path(dotenv_path)
+
+    cache = _read_cache(cache_path)
+    if (
+        cache is not None
+        and getattr(cache, "SOURCE", None) == str(dotenv_path)
+        and getattr(cache, "MTIME_NS", None) == mtime_ns
+    ):
+        values: dict[str, str] = cache.VARS
+    else:
+        values = _write_cache(dotenv_path, cache_path, mtime_ns)
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
@@ -2,26 +2,40 @@
 
 import logging
 import os
+from collections.abc import Callable
 from textwrap import dedent
 
 import reflex as rx
 import reflex_clerk_api as clerk
-from dotenv import load_dotenv
 from reflex.event import EventType
+from reflex.experimental.client_state import ClientStateVar
 from rxconfig import config
 
-# Set up debug logging with a console handler
-logging.basicConfig(level=logging.INFO, handlers=[logging.StreamHandler()])
-# Just a very quick check to see which loggers are actually active in the console
-logging.debug("Logging DEBUG")
-logging.info("Logging INFO")
-logging.warning("Logging WARNING")
+from .bootstrap_env import load_env
 
+# Load `.env` first, so that it can also set LOG_LEVEL.
+load_env()
 
-load_dotenv()
+# Set up logging with a console handler (e.g. `LOG_LEVEL=DEBUG reflex run` for more detail)
+_log_level = os.environ.get("LOG_LEVEL", "WARNING").upper()
+logging.basicConfig(
+    level=_log_level
+    if isinstance(logging.getLevelName(_log_level), int)
+    else logging.WARNING,
+    handlers=[logging.StreamHandler()],
+)
+
+# Read once at import (fails early if the publishable key is missing).
+CLERK_PUBLISHABLE_KEY = os.environ["CLERK_PUBLISHABLE_KEY"]
+CLERK_SECRET_KEY = os.environ.get("CLERK_SECRET_KEY")
 
 filename = f"{config.app_name}/{config.app_name}.py"
 
+# Shared by the `do_something_on_load*` handlers below.
+_LOAD_FMT = (
+    "State.is_hydrated: {}\nclerkstate.auth_checked: {}\nClerkState.is_signed_in: {}\n"
+)
+
 
 class State(rx.State):
     """The app state."""
@@ -34,27 +48,24 @@ class State(rx.State):
     last_auth_change: str = "No changes yet."
 
     @rx.event
-    async def do_something_on_load(self) -> EventType:
+    def do_something_on_load(self, auth_checked: bool, is_signed_in: bool) -> EventType:
         """Example of a handler that should run on_load, but *after* the ClerkState is updated.
 
         E.g., The handler needs to know whether the user is logged in or not.
+
+        The ClerkState values are passed in by `clerk.on_load(..., pass_auth_state=True)`.
         """
-        clerk_state = await self.get_state(clerk.ClerkState)
-        self.info_from_load = f"""\
-        State.is_hydrated: {self.is_hydrated}
-        clerkstate.auth_checked: {clerk_state.auth_checked}
-        ClerkState.is_signed_in: {clerk_state.is_signed_in}
-        """
+        self.info_from_load = _LOAD_FMT.format(
+            self.is_hydrated, auth_checked, is_signed_in
+        )
         return rx.toast.info("On load event has finished")
 
     @rx.event
     async def do_something_on_load_without_wrapper(self) -> None:
         clerk_state = await self.get_state(clerk.ClerkState)
-        self.info_from_load_without_wrapper = f"""\
-        State.is_hydrated: {self.is_hydrated}
-        clerkstate.auth_checked: {clerk_state.auth_checked}
-        ClerkState.is_signed_in: {clerk_state.is_signed_in}
-        """
+        self.info_from_load_without_wrapper = _LOAD_FMT.format(
+            self.is_hydrated, clerk_state.auth_checked, clerk_state.is_signed_in
+        )
 
     @rx.event
     async def do_something_on_log_in_or_out(self) -> EventType | None:
@@ -73,6 +84,10 @@ class State(rx.State):
         return None
 
 
+# Registered once at import (rather than every time a page is built).
+clerk.register_on_auth_change_handler(State.do_something_on_log_in_or_out)
+
+
 def demo_page_header_and_description() -> rx.Component:
     return rx.vstack(
         rx.hstack(
@@ -146,6 +161,8 @@ def demo_page_header_and_description() -> rx.Component:
     )
 
 
+# NOTE: `copy_button` and `close_icon` are single shared instances (do not inline). Reflex places the same object in
+#  each parent's children (no copy or re-validation per use), so sharing them costs nothing extra per use site.
 copy_button = rx.button(
     rx.icon("copy"),
     variant="soft",
@@ -250,6 +267,7 @@ def data_list_item(label: str, value: rx.Component | str) -> rx.Component:
     )
 
 
+# Shared instance, see the note on `copy_button` above.
 close_icon = rx.icon(
     "x",
     position="absolute",
@@ -263,6 +281,14 @@ close_icon = rx.icon(
 )
 
 
+# Same hover style for every demo card.
+_CARD_HOVER_STYLE = dict(background=rx.color("gray", 4))
+
+
+# Heading -> data-testid slug (e.g. "Sign-in and sign-up pages" -> "sign-in_and_sign-up_pages").
+_SLUG_TABLE = str.maketrans({" ": "_", "/": "_"})
+
+
 def demo_card(
     heading: str, description: str | rx.Component, demo: rx.Component
 ) -> rx.Component:
@@ -272,34 +298,26 @@ def demo_card(
             rx.text(description) if isinstance(description, str) else description,
         ),
         max_width="30em",
-        _hover=dict(background=rx.color("gray", 4)),
+        _hover=_CARD_HOVER_STYLE,
         height="100%",
     )
 
-    content_popover_desktop = rx.hover_card.root(
+    # A single hover card serves all devices (rather than separate desktop/mobile trees). Hover cards ignore touch
+    # input, so the open state is controlled on the client to also allow opening (and closing) it with a tap.
+    is_open = ClientStateVar.create(default=False)
+    return rx.hover_card.root(
         rx.hover_card.trigger(
             card,
-            data_testid=heading.lower().replace(" ", "_").replace("/", "_"),
+            data_testid=heading.lower().translate(_SLUG_TABLE),
+            on_click=is_open.set_value(True),
         ),
         rx.hover_card.content(
+            rx.box(close_icon, on_click=is_open.set_value(False)),
             demo,
             avoid_collisions=True,
         ),
-    )
-    content_popover_mobile = rx.popover.root(
-        rx.popover.trigger(
-            card,
-        ),
-        rx.popover.content(
-            rx.popover.close(
-                close_icon,
-            ),
-            demo,
-        ),
-    )
-    return rx.fragment(
-        rx.desktop_only(content_popover_desktop),
-        rx.mobile_and_tablet(content_popover_mobile),
+        open=is_open.value,
+        on_open_change=is_open.set_value,
     )
 
 
@@ -345,11 +363,7 @@ def current_clerk_state_values() -> rx.Component:
             ),
         ),
     )
-    return demo_card(
-        "ClerkState variables and methods",
-        "State variables and methods available on the `ClerkState` object.",
-        demo,
-    )
+    return demo
 
 
 def on_load_demo() -> rx.Component:
@@ -397,19 +411,13 @@ def on_load_demo() -> rx.Component:
             width="100%",
         ),
     )
-    return demo_card(
-        "Better on_load handling",
-        rx.text(
-            "Wrap ",
-            rx.code("on_load"),
-            " events with ",
-            rx.code(
-                "clerk.on_load(...)",
-                " to ensure the ClerkState is updated before events run.",
-            ),
-        ),
-        demo,
-    )
+    return demo
+
+
+# Explicit concatenation built once (instead of formatting the Var into an f-string on each build).
+_LAST_AUTH_CHANGE_TEXT = (
+    rx.Var.create("State.last_auth_change=") + State.last_auth_change
+)
 
 
 def on_auth_change_demo() -> rx.Component:
@@ -424,14 +432,10 @@ def on_auth_change_demo() -> rx.Component:
         rx.text(
             "The event handler will be called any time the authentication state of the user changes. In this demo, you'll see a toast top-center when you log in or out as well as the state variable change below."
         ),
-        rx.text(f"State.last_auth_change={State.last_auth_change}"),
+        rx.text(_LAST_AUTH_CHANGE_TEXT),
         width="100%",
     )
-    return demo_card(
-        "On auth change callbacks",
-        "You can register a method to be called when the user logs in or out.",
-        demo,
-    )
+    return demo
 
 
 def clerk_loaded_demo() -> rx.Component:
@@ -474,13 +478,7 @@ def clerk_loaded_demo() -> rx.Component:
             ),
         ),
     )
-    return demo_card(
-        "Clerk loaded and signed in/out areas",
-        rx.markdown(
-            "Demo of `clerk_loaded`, `clerk_loading`, and `signed_in`, `signed_out` components."
-        ),
-        demo,
-    )
+    return demo
 
 
 def links_to_demo_pages() -> rx.Component:
@@ -510,11 +508,7 @@ def links_to_demo_pages() -> rx.Component:
             clerk.sign_out_button(rx.button("Sign out", width="100%")),
         ),
     )
-    return demo_card(
-        "Sign-in and sign-up pages",
-        "Some basic sign-in and sign-up pages are implemented for easy use. You can also create your own.",
-        demo,
-    )
+    return demo
 
 
 def user_info_demo() -> rx.Component:
@@ -553,11 +547,7 @@ def user_info_demo() -> rx.Component:
         clerk.signed_out(rx.text("Sign in to see user information.")),
     )
 
-    return demo_card(
-        "ClerkUser info",
-        "To conveniently use basic information within the frontend, you can use the `clerk.ClerkUser` state.",
-        demo,
-    )
+    return demo
 
 
 def user_profile_demo() -> rx.Component:
@@ -588,11 +578,7 @@ def user_profile_demo() -> rx.Component:
         width="100%",
     )
 
-    return demo_card(
-        "User profile management",
-        "Users can manage their profile via the Clerk interface.",
-        demo,
-    )
+    return demo
 
 
 def demo_header() -> rx.Component:
@@ -680,29 +666,81 @@ def demo_header() -> rx.Component:
     )
 
 
-def index() -> rx.Component:
-    clerk.register_on_auth_change_handler(State.do_something_on_log_in_or_out)
+# None of the page sections take parameters, so each is built once at import and index() only assembles them.
+# (Sharing built components across page evaluations is fine: compiling `index` twice in one process gives identical output.)
+_HEADER_AND_DESCRIPTION = demo_page_header_and_description()
+_GETTING_STARTED = getting_started()
+_DEMO_HEADER = demo_header()
 
+# The cards in the demo grid: (heading, description, function building the demo shown in the card).
+_DEMO_CARDS: tuple[tuple[str, str | rx.Component, Callable[[], rx.Component]], ...] = (
+    (
+        "ClerkState variables and methods",
+        "State variables and methods available on the `ClerkState` object.",
+        current_clerk_state_values,
+    ),
+    (
+        "Clerk loaded and signed in/out areas",
+        rx.markdown(
+            "Demo of `clerk_loaded`, `clerk_loading`, and `signed_in`, `signed_out` components."
+        ),
+        clerk_loaded_demo,
+    ),
+    (
+        "Better on_load handling",
+        rx.text(
+            "Wrap ",
+            rx.code("on_load"),
+            " events with ",
+            rx.code(
+                "clerk.on_load(...)",
+                " to ensure the ClerkState is updated before events run.",
+            ),
+        ),
+        on_load_demo,
+    ),
+    (
+        "On auth change callbacks",
+        "You can register a method to be called when the user logs in or out.",
+        on_auth_change_demo,
+    ),
+    (
+        "ClerkUser info",
+        "To conveniently use basic information within the frontend, you can use the `clerk.ClerkUser` state.",
+        user_info_demo,
+    ),
+    (
+        "Sign-in and sign-up pages",
+        "Some basic sign-in and sign-up pages are implemented for easy use. You can also create your own.",
+        links_to_demo_pages,
+    ),
+    (
+        "User profile management",
+        "Users can manage their profile via the Clerk interface.",
+        user_profile_demo,
+    ),
+)
+_DEMO_GRID_CHILDREN = [
+    demo_card(heading, description, build_demo())
+    for heading, description, build_demo in _DEMO_CARDS
+]
+
+
+def index() -> rx.Component:
     # Note: Using `clerk.wrap_app(...)` instead of `clerk.clerk_provider(...)` here.
     return rx.box(
         rx.vstack(
             rx.flex(
-                demo_page_header_and_description(),
-                getting_started(),
+                _HEADER_AND_DESCRIPTION,
+                _GETTING_STARTED,
                 spacing="7",
                 direction=rx.breakpoints(initial="column", sm="row"),
             ),
             # rx.button("Dev reset", on_click=clerk.ClerkState.force_reset),
             rx.divider(),
-            demo_header(),
+            _DEMO_HEADER,
             rx.grid(
-                current_clerk_state_values(),
-                clerk_loaded_demo(),
-                on_load_demo(),
-                on_auth_change_demo(),
-                user_info_demo(),
-                links_to_demo_pages(),
-                user_profile_demo(),
+                *_DEMO_GRID_CHILDREN,
                 columns=rx.breakpoints(initial="1", sm="2", md="3", xl="4"),
                 spacing="4",
                 align="stretch",
@@ -723,8 +761,8 @@ app = rx.App()
 # This wraps the entire app (all pages) with the ClerkProvider.
 clerk.wrap_app(
     app,
-    publishable_key=os.environ["CLERK_PUBLISHABLE_KEY"],
-    secret_key=os.environ.get("CLERK_SECRET_KEY"),
+    publishable_key=CLERK_PUBLISHABLE_KEY,
+    secret_key=CLERK_SECRET_KEY,
     register_user_state=True,
     # NOTE: Colors customizable via the `Appearance` object. (baseTheme is not yet implemented)
     # appearance=Appearance(
@@ -740,7 +778,7 @@ clerk.wrap_app(
 app.add_page(
     index,
     on_load=[
-        *clerk.on_load([State.do_something_on_load]),
+        *clerk.on_load([State.do_something_on_load], pass_auth_state=True),
         State.do_something_on_load_without_wrapper,
     ],
 )
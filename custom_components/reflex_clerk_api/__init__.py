@@ -1,38 +1,84 @@
 __version__ = "1.0.1"
 
-from .authentication_components import sign_in, sign_up
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .clerk_provider import (
     ClerkState,
     ClerkUser,
     clerk_provider,
+    get_user,
     on_load,
+    on_load_batched,
     register_on_auth_change_handler,
     wrap_app,
 )
-from .control_components import (
-    clerk_loaded,
-    clerk_loading,
-    protect,
-    redirect_to_user_profile,
-    signed_in,
-    signed_out,
-)
-from .pages import add_sign_in_page, add_sign_up_page
-from .unstyled_components import (
-    SignInButton,
-    sign_in_button,
-    sign_out_button,
-    sign_up_button,
-)
-from .user_components import user_button, user_profile
-from .organization_components import (
-    create_organization,
-    organization_profile,
-    organization_switcher,
-    organization_list,
-)
 
-__all__ = [
+if TYPE_CHECKING:
+    from .authentication_components import sign_in, sign_up
+    from .control_components import (
+        clerk_loaded,
+        clerk_loading,
+        protect,
+        redirect_to_user_profile,
+        signed_in,
+        signed_out,
+    )
+    from .pages import add_sign_in_page, add_sign_up_page
+    from .unstyled_components import (
+        SignInButton,
+        sign_in_button,
+        sign_out_button,
+        sign_up_button,
+    )
+    from .user_components import user_button, user_profile
+    from .organization_components import (
+        create_organization,
+        organization_profile,
+        organization_switcher,
+        organization_list,
+    )
+
+# The component modules are only imported once one of their exports is first used (PEP 562).
+# NOTE: `clerk_provider` is always imported since its submodule name clashes with the `clerk_provider` function.
+_LAZY_EXPORTS: dict[str, str] = {
+    "sign_in": "authentication_components",
+    "sign_up": "authentication_components",
+    "clerk_loaded": "control_components",
+    "clerk_loading": "control_components",
+    "protect": "control_components",
+    "redirect_to_user_profile": "control_components",
+    "signed_in": "control_components",
+    "signed_out": "control_components",
+    "add_sign_in_page": "pages",
+    "add_sign_up_page": "pages",
+    "SignInButton": "unstyled_components",
+    "sign_in_button": "unstyled_components",
+    "sign_out_button": "unstyled_components",
+    "sign_up_button": "unstyled_components",
+    "user_button": "user_components",
+    "user_profile": "user_components",
+    "create_organization": "organization_components",
+    "organization_profile": "organization_components",
+    "organization_switcher": "organization_components",
+    "organization_list": "organization_components",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
+
+__all__ = (
     "ClerkState",
     "ClerkUser",
     "SignInButton",
@@ -42,7 +88,9 @@ __all__ = [
     "clerk_loading",
     "clerk_provider",
     "create_organization",
+    "get_user",
     "on_load",
+    "on_load_batched",
     "organization_list",
     "organization_profile",
     "organization_switcher",
@@ -59,4 +107,4 @@ __all__ = [
     "user_button",
     "user_profile",
     "wrap_app",
-]
+)
@@ -1,21 +1,33 @@
 import asyncio
+import hashlib
+import inspect
+import itertools
 import logging
 import os
 import time
-import uuid
-from typing import Any, Callable, ClassVar, TypeVar
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, TypeVar
 
 import authlib.jose.errors as jose_errors
-import clerk_backend_api
 import reflex as rx
-from authlib.jose import JWTClaims, jwt
-from reflex.event import EventCallback, EventType, IndividualEventType
+from authlib.jose import JsonWebKey, JsonWebToken, JWTClaims, KeySet
+from reflex.event import EventCallback, EventSpec, EventType, IndividualEventType
 from reflex.utils.exceptions import ImmutableStateError
 
 from reflex_clerk_api.base import ClerkBase
 
 from .models import Appearance
 
+if TYPE_CHECKING:
+    # NOTE: Imported where needed at runtime since it is slow to import and only needed once the backend api is used.
+    import clerk_backend_api
+
+logger = logging.getLogger(__name__)
+
+# Clerk signs session tokens with RS256. Only accepting that rejects tokens with any other `alg` header
+#  (e.g. "none" or HS256) before any key lookup or signature check is attempted.
+jwt = JsonWebToken(["RS256"])
+
 
 class ReflexClerkApiError(Exception):
     pass
@@ -46,12 +58,33 @@ class ClerkState(rx.State):
     _auth_wait_timeout_seconds: ClassVar[float] = 1.0
     _secret_key: ClassVar[str | None] = None
     """The Clerk secret_key set during clerk_provider creation."""
-    _on_load_events: ClassVar[dict[uuid.UUID, EventType[()]]] = {}
-    _dependent_handlers: ClassVar[dict[int, EventCallback]] = {}
-    _client: ClassVar[clerk_backend_api.Clerk | None] = None
-    _jwk_keys: ClassVar[dict[str, Any] | None] = None
-    "JWK keys from Clerk for decoding any users JWT tokens (only required once per instance)."
-    _last_jwk_reset: ClassVar[float] = 0.0
+    _on_load_events: ClassVar[OrderedDict[int, EventType[()]]] = OrderedDict()
+    """Registered on_load events (least recently used first). Entries are shared by every visit to the page."""
+    _on_load_events_max_size: ClassVar[int] = 4096
+    _on_load_uids: ClassVar[Iterator[int]] = itertools.count()
+    """Ids for on_load registrations (only used as registry keys, so a counter is enough)."""
+    _auth_checked_events: ClassVar[dict[str, asyncio.Event]] = {}
+    """Per client token, set once the auth check completes (to wake up any waiting on_load events)."""
+    _auth_checked_waiters: ClassVar[dict[str, int]] = {}
+    """Per client token, the number of on_load events currently waiting for the auth check."""
+    _dependent_handlers: ClassVar[dict[tuple[str, Callable], EventCallback]] = {}
+    _client: ClassVar[Any] = None
+    """The `clerk_backend_api.Clerk` client (typed as Any since `clerk_backend_api` is imported lazily)."""
+    _jwk_keys: ClassVar[KeySet | None] = None
+    """JWK keys from Clerk for decoding any users JWT tokens (only required once per instance).
+
+    Kept as an imported `KeySet`, so the public keys are not rebuilt from the JWK dicts on every decode."""
+    _jwk_keys_fetched_at: ClassVar[float] = 0.0
+    """When the JWK keys were fetched (`time.monotonic()`, so wall-clock adjustments do not affect the max age)."""
+    _jwk_keys_max_age_seconds: ClassVar[float] = 600.0
+    """Once the JWK keys are older than this, they are re-fetched in the background (still used meanwhile)."""
+    _jwk_refresh_task: ClassVar["asyncio.Task[None] | None"] = None
+    _jwk_refresh_retry_at: ClassVar[float] = float("-inf")
+    """After a failed background refresh, no other refresh is started before this time (`time.monotonic()`)."""
+    _jwk_refresh_retry_seconds: ClassVar[float] = 10.0
+    _last_jwk_reset: ClassVar[float] = float("-inf")
+    _jwk_keys_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+    """Ensures only one JWK fetch is in flight, however many sessions need the keys at the same time."""
     _claims_options: ClassVar[dict[str, Any]] = {
         # "iss": {"value": "https://<your-iss>.clerk.accounts.dev"},
         "exp": {"essential": True},
@@ -60,6 +93,11 @@ class ClerkState(rx.State):
     }
     _jwt_validate_leeway_seconds: ClassVar[int] = 60
     """Clock-skew leeway (seconds) for validating JWT claims like exp/nbf."""
+    _validated_tokens: ClassVar[OrderedDict[bytes, tuple[float, JWTClaims]]] = (
+        OrderedDict()
+    )
+    """Recently validated tokens (keyed by a hash of the token) -> (exp, claims), to skip re-verifying them."""
+    _validated_tokens_max_size: ClassVar[int] = 1024
 
     @classmethod
     def register_dependent_handler(cls, handler: EventCallback) -> None:
@@ -68,9 +106,12 @@ class ClerkState(rx.State):
         I.e. Any events that should be triggered on login/logout.
         """
         assert isinstance(handler, rx.EventHandler)
-        hash_id = hash((handler.state_full_name, handler.fn))
-        logging.debug(f"Dependent hash_id: {hash_id}")
-        cls._dependent_handlers[hash_id] = handler
+        # Keyed by the (state, function) itself rather than its hash, so distinct handlers can't collide.
+        key = (handler.state_full_name, handler.fn)
+        logger.debug(
+            "Dependent handler: %s.%s", handler.state_full_name, handler.fn.__name__
+        )
+        cls._dependent_handlers[key] = handler
 
     @classmethod
     def set_auth_wait_timeout_seconds(cls, seconds: float) -> None:
@@ -85,6 +126,7 @@ class ClerkState(rx.State):
     def set_claims_options(cls, claims_options: dict[str, Any]) -> None:
         """Set the claims options for the JWT claims validation."""
         cls._claims_options = claims_options
+        cls._validated_tokens.clear()
 
     @classmethod
     def set_jwt_validate_leeway_seconds(cls, seconds: int) -> None:
@@ -108,9 +150,10 @@ class ClerkState(rx.State):
                 f"jwt_validate_leeway_seconds exceeds maximum of 3600 (1 hour), got {seconds}"
             )
         cls._jwt_validate_leeway_seconds = seconds
+        cls._validated_tokens.clear()
 
     @property
-    def client(self) -> clerk_backend_api.Clerk:
+    def client(self) -> "clerk_backend_api.Clerk":
         if self._client is None:
             self._set_client()
         assert self._client is not None
@@ -124,36 +167,52 @@ class ClerkState(rx.State):
 
         Note: Only the parts that modify the per-instance state need to be in an `async with self` block.
         """
-        logging.debug("Setting Clerk session")
-        jwks = await self._get_jwk_keys()
-        try:
-            decoded: JWTClaims = jwt.decode(
-                token, {"keys": jwks}, claims_options=self._claims_options
-            )
-        except jose_errors.DecodeError as e:
-            # E.g. DecodeError -- Something went wrong just getting the JWT
-            # On next attempt, new JWKs will be fetched
-            async with self:
-                self.auth_error = e
-            self._request_jwk_reset()
-            logging.warning(f"JWT decode error: {e}")
-            return ClerkState.clear_clerk_session
-        try:
-            # Validate the token according to the claim options (e.g. iss, exp, nbf, azp.)
-            decoded.validate(leeway=self._jwt_validate_leeway_seconds)
-        except (
-            jose_errors.ExpiredTokenError,
-            jose_errors.InvalidClaimError,
-            jose_errors.MissingClaimError,
-        ) as e:
-            logging.warning(f"JWT token validation failed: {type(e).__name__}: {e}")
-            return ClerkState.clear_clerk_session
+        logger.debug("Setting Clerk session")
+        token_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        decoded = self._get_validated_claims(token_key)
+        if decoded is None:
+            try:
+                decoded = await self._decode_jwt(token)
+            except jose_errors.DecodeError as e:
+                # E.g. DecodeError -- Something went wrong just getting the JWT
+                # On next attempt, new JWKs will be fetched
+                self._request_jwk_reset()
+                logger.warning("JWT decode error: %s", e)
+                return ClerkState.clear_clerk_session
+            except jose_errors.JoseError as e:
+                # E.g. BadSignatureError or UnsupportedAlgorithmError -- The JWT itself can't be trusted
+                logger.warning("JWT rejected: %s: %s", type(e).__name__, e)
+                return ClerkState.clear_clerk_session
+            try:
+                # Validate the token according to the claim options (e.g. iss, exp, nbf, azp.)
+                decoded.validate(leeway=self._jwt_validate_leeway_seconds)
+            except (
+                jose_errors.ExpiredTokenError,
+                jose_errors.InvalidTokenError,
+                jose_errors.InvalidClaimError,
+                jose_errors.MissingClaimError,
+            ) as e:
+                logger.warning(
+                    "JWT token validation failed: %s: %s", type(e).__name__, e
+                )
+                return ClerkState.clear_clerk_session
+            self._cache_validated_claims(token_key, decoded)
 
         async with self:
-            self.is_signed_in = True
-            self.claims = decoded
-            self.user_id = str(decoded.get("sub"))
-            self.auth_checked = True
+            # Re-syncing the same session (e.g. after a websocket reconnect) changes nothing. Reflex sends
+            # every assigned var in the next delta (even if unchanged), and the claims are the whole JWT
+            # payload, so skip the writes (and the dependent handlers) in that case.
+            session_changed = not (
+                self.is_signed_in and self.auth_checked and self.claims == decoded
+            )
+            if session_changed:
+                self.is_signed_in = True
+                self.claims = decoded
+                self.user_id = str(decoded.get("sub"))
+                self.auth_checked = True
+        self._notify_auth_checked()
+        if not session_changed:
+            return []
         return list(self._dependent_handlers.values())
 
     @rx.event
@@ -162,38 +221,138 @@ class ClerkState(rx.State):
 
         This event is triggered by the frontend via the ClerkSessionSynchronizer/ClerkProvider component.
         """
-        logging.debug("Clearing Clerk session")
+        logger.debug("Clearing Clerk session")
         self.reset()
         self.auth_checked = True
+        self._notify_auth_checked()
         return list(self._dependent_handlers.values())
 
     @rx.event(background=True)
-    async def wait_for_auth_check(self, uid: uuid.UUID | str) -> EventType:
+    async def wait_for_auth_check(
+        self, uid: int, pass_auth_state: bool = False
+    ) -> EventType:
         """Wait for the Clerk authentication to complete (event sent from frontend).
 
         Can't just use a blocking wait_for_auth_check because we are really waiting for the frontend event trigger to run, so we need to not block that while we wait.
 
         This can then return on_load events once auth_checked is True.
+
+        Args:
+            uid: The id the on_load events were registered with.
+            pass_auth_state: Whether to pass `auth_checked` and `is_signed_in` as arguments to the on_load events.
         """
-        uid = uuid.UUID(uid) if isinstance(uid, str) else uid
-        logging.debug(f"Waiting for auth check: {uid} ({type(uid)})")
+        logger.debug("Waiting for auth check: %s", uid)
 
-        on_loads = self._on_load_events.get(uid, None)
+        on_loads = self._get_on_load_events(uid)
         if on_loads is None:
-            logging.warning("Waited for auth, but no on_load events registered.")
+            logger.warning("Waited for auth, but no on_load events registered.")
             on_loads = []
 
-        start_time = time.time()
-        while time.time() - start_time < self._auth_wait_timeout_seconds:
-            if self.auth_checked:
-                logging.debug("Auth check complete")
-                return on_loads
-            logging.debug("...waiting for auth...")
-            # TODO: Ideally, wait on some event instead of sleeping
-            await asyncio.sleep(0.05)
-        logging.warning("Auth check timed out")
+        auth_checked, is_signed_in = await self._wait_until_auth_checked()
+        if pass_auth_state:
+            return self._with_auth_state_args(on_loads, auth_checked, is_signed_in)
         return on_loads
 
+    @rx.event(background=True)
+    async def run_on_load_batch(self, uid: int) -> EventType:
+        """Wait for the Clerk authentication to complete, then run the registered on_load handlers as one batch.
+
+        Instead of returning the handlers as separate events (each processed with its own state lock and
+        frontend update), they are called directly within a single `async with self` block. Any events the
+        handlers return are returned together afterwards.
+        """
+        logger.debug("Waiting for auth check (batched): %s", uid)
+
+        handlers = self._get_on_load_events(uid)
+        if not isinstance(handlers, list):
+            logger.warning("Waited for auth, but no on_load events registered.")
+            return []
+
+        await self._wait_until_auth_checked()
+        follow_up_events: list[IndividualEventType] = []
+        async with self:
+            for handler in handlers:
+                assert isinstance(handler, rx.EventHandler)
+                state_cls = rx.State.get_class_substate(handler.state_full_name)
+                state = await self.get_state(state_cls)
+                events = handler.fn(state)
+                if inspect.isawaitable(events):
+                    events = await events
+                if inspect.isasyncgen(events):
+                    events = [event async for event in events]
+                elif inspect.isgenerator(events):
+                    events = list(events)
+                if events is None:
+                    continue
+                if isinstance(events, list):
+                    follow_up_events.extend(events)
+                else:
+                    follow_up_events.append(events)
+        return follow_up_events
+
+    async def _wait_until_auth_checked(self) -> tuple[bool, bool]:
+        """Wait until the auth state has been checked (or the timeout is reached).
+
+        Returns:
+            The `auth_checked` and `is_signed_in` values once done waiting.
+        """
+        client_token = self.router.session.client_token
+        # Checked under the lock (fresh state), and the event is registered before releasing it, so a
+        # concurrent set/clear_clerk_session can't complete in between without notifying this waiter.
+        async with self:
+            if self.auth_checked:
+                logger.debug("Auth check complete")
+                return self.auth_checked, self.is_signed_in
+            event = self._auth_checked_events.setdefault(client_token, asyncio.Event())
+            self._auth_checked_waiters[client_token] = (
+                self._auth_checked_waiters.get(client_token, 0) + 1
+            )
+        logger.debug("...waiting for auth...")
+        try:
+            await asyncio.wait_for(event.wait(), self._auth_wait_timeout_seconds)
+            logger.debug("Auth check complete")
+        except asyncio.TimeoutError:
+            logger.warning("Auth check timed out")
+        finally:
+            # Other on_load events of this client may still be waiting for the same event, so it is only
+            #  dropped (if not already popped by `_notify_auth_checked`) once the last of them is done.
+            remaining = self._auth_checked_waiters[client_token] - 1
+            if remaining:
+                self._auth_checked_waiters[client_token] = remaining
+            else:
+                del self._auth_checked_waiters[client_token]
+                self._auth_checked_events.pop(client_token, None)
+        # Outside `async with self` the proxy may hold a stale snapshot (e.g. with redis), so reload first.
+        async with self:
+            return self.auth_checked, self.is_signed_in
+
+    def _notify_auth_checked(self) -> None:
+        """Wake up any on_load events waiting for the auth check of this client."""
+        event = self._auth_checked_events.pop(self.router.session.client_token, None)
+        if event is not None:
+            event.set()
+
+    @staticmethod
+    def _with_auth_state_args(
+        events: EventType[()], auth_checked: bool, is_signed_in: bool
+    ) -> list[IndividualEventType]:
+        """Bind the `auth_checked` and `is_signed_in` values as arguments of the events.
+
+        Saves the events from having to `get_state(ClerkState)` just to read these values.
+        Only `EventHandler`s and `EventSpec`s can take the arguments (checked in `on_load`).
+        """
+        events = events if isinstance(events, list) else [events]
+        bound: list[IndividualEventType] = []
+        for event in events:
+            if isinstance(event, rx.EventHandler):
+                event = event(auth_checked, is_signed_in)
+            elif isinstance(event, EventSpec):
+                event = event.add_args(
+                    rx.Var.create(auth_checked), rx.Var.create(is_signed_in)
+                )
+            bound.append(event)
+        return bound
+
     @classmethod
     def _set_secret_key(cls, secret_key: str) -> None:
         if not secret_key:
@@ -201,12 +360,26 @@ class ClerkState(rx.State):
         cls._secret_key = secret_key
 
     @classmethod
-    def _set_on_load_events(cls, uid: uuid.UUID, on_load_events: EventType[()]) -> None:
-        logging.debug(f"Registing on_load events: {uid}")
+    def _set_on_load_events(cls, uid: int, on_load_events: EventType[()]) -> None:
+        logger.debug("Registing on_load events: %s", uid)
         cls._on_load_events[uid] = on_load_events
+        # Registrations normally happen once per page, but bound the registry in case `on_load(...)` is
+        #  called repeatedly at runtime (e.g. from within event handlers).
+        if len(cls._on_load_events) > cls._on_load_events_max_size:
+            evicted_uid, _ = cls._on_load_events.popitem(last=False)
+            logger.warning("Too many on_load registrations, dropped: %s", evicted_uid)
+
+    @classmethod
+    def _get_on_load_events(cls, uid: int) -> EventType[()] | None:
+        on_load_events = cls._on_load_events.get(uid, None)
+        if on_load_events is not None:
+            cls._on_load_events.move_to_end(uid)
+        return on_load_events
 
     @classmethod
     def _set_client(cls) -> None:
+        import clerk_backend_api
+
         if cls._secret_key:
             secret_key = cls._secret_key
         else:
@@ -219,38 +392,139 @@ class ClerkState(rx.State):
         cls._client = client
 
     @classmethod
-    def _set_jwk_keys(cls, keys: dict[str, Any] | None) -> None:
+    def _get_validated_claims(cls, token_key: bytes) -> JWTClaims | None:
+        """Get the claims of an already validated token, if it has not expired since.
+
+        Uses the same leeway as `JWTClaims.validate`, so a token stays cached exactly as long as it would pass
+        validation again.
+        """
+        cached = cls._validated_tokens.get(token_key)
+        if cached is None:
+            return None
+        exp, claims = cached
+        if time.time() > exp + cls._jwt_validate_leeway_seconds:
+            del cls._validated_tokens[token_key]
+            return None
+        cls._validated_tokens.move_to_end(token_key)
+        return claims
+
+    @classmethod
+    def _cache_validated_claims(cls, token_key: bytes, claims: JWTClaims) -> None:
+        """Remember a validated token (least recently used tokens are dropped first)."""
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        cls._validated_tokens[token_key] = (exp, claims)
+        if len(cls._validated_tokens) > cls._validated_tokens_max_size:
+            cls._validated_tokens.popitem(last=False)
+
+    @classmethod
+    def _set_jwk_keys(cls, keys: KeySet | None) -> None:
         cls._jwk_keys = keys
+        if keys is not None:
+            cls._jwk_keys_fetched_at = time.monotonic()
 
     @classmethod
-    def _request_jwk_reset(cls) -> None:
+    def _request_jwk_reset(cls) -> bool:
         """Reset the JWK keys so they will be re-fetched on next attempt.
 
         Only do so if it has been a while since last reset (to prevent malicious tokens from forcing
         constant re-fetching).
+
+        Returns:
+            Whether the keys were reset.
         """
-        now = time.time()
+        now = time.monotonic()
         if now - cls._last_jwk_reset < 10:
-            logging.warning("JWK reset requested too soon")
-            return
-        cls._last_jwk_reset = time.time()
+            logger.warning("JWK reset requested too soon")
+            return False
+        cls._last_jwk_reset = now
         cls._jwk_keys = None
+        return True
 
-    async def _get_jwk_keys(self) -> dict[str, Any]:
+    async def _decode_jwt(self, token: str) -> JWTClaims:
+        """Decode the JWT and verify its signature with the JWK keys from Clerk.
+
+        If none of the keys match the token's `kid` (e.g. Clerk has rotated its keys), the keys are
+        re-fetched straight away and the token is decoded once more.
+        """
+        try:
+            return jwt.decode(
+                token, await self._get_jwk_keys(), claims_options=self._claims_options
+            )
+        except ValueError as e:
+            # authlib raises a plain ValueError when no key in the set matches the token's kid.
+            if not self._request_jwk_reset():
+                raise jose_errors.DecodeError(f"No matching JWK: {e}") from e
+        try:
+            return jwt.decode(
+                token, await self._get_jwk_keys(), claims_options=self._claims_options
+            )
+        except ValueError as e:
+            raise jose_errors.DecodeError(f"No matching JWK: {e}") from e
+
+    async def _get_jwk_keys(self) -> KeySet:
         """Get the JWK keys from the Clerk API.
 
         Note: Cannot be a property because it requires async call to populate.
-        Only needs to be done once (will be refreshed on errors).
+        Fetched once, then refreshed in the background once they are older than `_jwk_keys_max_age_seconds`
+        (and straight away on errors).
         """
-        if self._jwk_keys:
+        if self._jwk_keys is not None:
+            if (
+                time.monotonic() - self._jwk_keys_fetched_at
+                > self._jwk_keys_max_age_seconds
+            ):
+                ClerkState._schedule_jwk_refresh()
             return self._jwk_keys
-        jwks = await self.client.jwks.get_jwks_async()
+        async with ClerkState._jwk_keys_lock:
+            # Another session may have fetched the keys while waiting for the lock.
+            if self._jwk_keys is not None:
+                return self._jwk_keys
+            return await ClerkState._fetch_jwk_keys()
+
+    @classmethod
+    async def _fetch_jwk_keys(cls) -> KeySet:
+        """Fetch the JWK keys from the Clerk API (with the `_jwk_keys_lock` held)."""
+        if cls._client is None:
+            cls._set_client()
+        jwks = await cls._client.jwks.get_jwks_async()
         assert jwks is not None
         assert jwks.keys is not None
-        keys = jwks.model_dump()["keys"]
-        self._set_jwk_keys(keys)
+        keys = JsonWebKey.import_key_set({"keys": jwks.model_dump()["keys"]})
+        cls._set_jwk_keys(keys)
         return keys
 
+    @classmethod
+    def _schedule_jwk_refresh(cls) -> None:
+        """Re-fetch the JWK keys in a background task (unless a refresh is already running or recently failed)."""
+        if cls._jwk_refresh_task is not None and not cls._jwk_refresh_task.done():
+            return
+        if time.monotonic() < cls._jwk_refresh_retry_at:
+            # The last refresh failed only recently (e.g. Clerk is down), don't call the API on every token.
+            return
+        cls._jwk_refresh_task = asyncio.create_task(cls._refresh_jwk_keys())
+
+    @classmethod
+    async def _refresh_jwk_keys(cls) -> None:
+        async with cls._jwk_keys_lock:
+            if (
+                time.monotonic() - cls._jwk_keys_fetched_at
+                <= cls._jwk_keys_max_age_seconds
+            ):
+                # Already re-fetched while waiting for the lock.
+                return
+            try:
+                await cls._fetch_jwk_keys()
+            except Exception as e:
+                # The current keys stay in use, the refresh is tried again on a token after the retry interval.
+                cls._jwk_refresh_retry_at = (
+                    time.monotonic() + cls._jwk_refresh_retry_seconds
+                )
+                logger.warning(
+                    "Failed to refresh JWK keys: %s: %s", type(e).__name__, e
+                )
+
     # @rx.event
     # def force_reset(self) -> None:
     #     """Force a reset of the Clerk state.
@@ -287,35 +561,75 @@ class ClerkUser(rx.State):
     @rx.event
     async def load_user(self) -> None:
         try:
-            user: clerk_backend_api.models.User = await get_user(self)
+            user: "clerk_backend_api.models.User" = await get_user(self)
         except MissingUserError:
-            logging.debug("Clearing user state")
+            logger.debug("Clearing user state")
             self.reset()
             return
 
-        logging.debug("Updating user state")
-        self.first_name = (
-            user.first_name
-            if user.first_name and user.first_name != clerk_backend_api.UNSET
-            else ""
-        )
-        self.last_name = (
-            user.last_name
-            if user.last_name and user.last_name != clerk_backend_api.UNSET
-            else ""
-        )
-        self.username = (
-            user.username
-            if user.username and user.username != clerk_backend_api.UNSET
-            else ""
-        )
+        logger.debug("Updating user state")
+        # NOTE: `clerk_backend_api.UNSET` is falsy, so `or ""` covers both missing and unset fields.
+        self.first_name = user.first_name or ""
+        self.last_name = user.last_name or ""
+        self.username = user.username or ""
         self.email_address = (
             user.email_addresses[0].email_address if user.email_addresses else ""
         )
-        self.has_image = True if user.has_image is True else False
+        self.has_image = user.has_image is True
         self.image_url = user.image_url or ""
 
 
+# `__CLERK_STATE__` is replaced with the full name of the ClerkState.
+_SESSION_SYNCHRONIZER_JS_TEMPLATE = """
+function ClerkSessionSynchronizer({ children }) {
+  const { getToken, isLoaded, isSignedIn } = useAuth()
+  const [ addEvents ] = useContext(EventLoopContext)
+  const lastSentRef = useRef({ stateKey: null, addEvents: null })
+
+  useEffect(() => {
+      // Wait for all dependencies to be ready.
+      if (!isLoaded || !addEvents) return
+
+      // Deduplicate rapid calls, but remain reconnect-safe:
+      // addEvents identity changes across websocket reconnects, so include it in the key.
+      const stateKey = isSignedIn ? "signed_in" : "signed_out"
+      if (
+        lastSentRef.current?.stateKey === stateKey &&
+        lastSentRef.current?.addEvents === addEvents
+      ) return
+      lastSentRef.current = { stateKey, addEvents }
+
+      // Work out the single event to send first, then dispatch it with one addEvents call.
+      const syncSession = async () => {
+        let event = ReflexEvent("__CLERK_STATE__.clear_clerk_session")
+        if (isSignedIn) {
+          try {
+            // Prefer a fresh token; cached tokens can be close to expiry.
+            // If this Clerk version doesn't support skipCache, fall back to the default call.
+            let token
+            try {
+              token = await getToken({ skipCache: true })
+            } catch {
+              token = await getToken()
+            }
+            // If the token is unavailable despite isSignedIn, clear to avoid stuck auth state.
+            if (token) event = ReflexEvent("__CLERK_STATE__.set_clerk_session", {token})
+          } catch {
+            // Token retrieval failed - clear to avoid stuck auth state.
+          }
+        }
+        addEvents([event])
+      }
+      syncSession()
+  }, [isLoaded, isSignedIn, addEvents, getToken])
+
+  return (
+      <>{children}</>
+  )
+}
+"""
+
+
 class ClerkSessionSynchronizer(rx.Component):
     """ClerkSessionSynchronizer component.
 
@@ -324,6 +638,8 @@ class ClerkSessionSynchronizer(rx.Component):
 
     tag = "ClerkSessionSynchronizer"
 
+    _custom_code: ClassVar[list[str] | None] = None
+
     def add_imports(
         self,
     ) -> rx.ImportDict:
@@ -336,56 +652,14 @@ class ClerkSessionSynchronizer(rx.Component):
         return addl_imports
 
     def add_custom_code(self) -> list[str]:
-        clerk_state_name = ClerkState.get_full_name()
-
-        return [
-            """
-function ClerkSessionSynchronizer({{ children }}) {{
-  const {{ getToken, isLoaded, isSignedIn }} = useAuth()
-  const [ addEvents ] = useContext(EventLoopContext)
-  const lastSentRef = useRef({{ stateKey: null, addEvents: null }})
-
-  useEffect(() => {{
-      // Wait for all dependencies to be ready.
-      if (!isLoaded || !addEvents) return
-
-      // Deduplicate rapid calls, but remain reconnect-safe:
-      // addEvents identity changes across websocket reconnects, so include it in the key.
-      const stateKey = isSignedIn ? "signed_in" : "signed_out"
-      if (
-        lastSentRef.current?.stateKey === stateKey &&
-        lastSentRef.current?.addEvents === addEvents
-      ) return
-      lastSentRef.current = {{ stateKey, addEvents }}
-
-      if (isSignedIn) {{
-        // Prefer a fresh token; cached tokens can be close to expiry.
-        // If this Clerk version doesn't support skipCache, fall back to the default call.
-        Promise.resolve()
-          .then(() => getToken({{ skipCache: true }}))
-          .catch(() => getToken())
-          .then(token => {{
-            if (token) {{
-              addEvents([ReflexEvent("{state}.set_clerk_session", {{token}})])
-            }} else {{
-              // Token unavailable despite isSignedIn - clear to avoid stuck auth state.
-              addEvents([ReflexEvent("{state}.clear_clerk_session")])
-            }}
-          }}).catch(() => {{
-            // Token retrieval failed - clear to avoid stuck auth state.
-            addEvents([ReflexEvent("{state}.clear_clerk_session")])
-          }})
-      }} else {{
-        addEvents([ReflexEvent("{state}.clear_clerk_session")])
-      }}
-  }}, [isLoaded, isSignedIn, addEvents, getToken])
-
-  return (
-      <>{{children}}</>
-  )
-}}
-""".format(state=clerk_state_name)
-        ]
+        # The code only depends on the (fixed) ClerkState name, so it is formatted once and reused.
+        if ClerkSessionSynchronizer._custom_code is None:
+            ClerkSessionSynchronizer._custom_code = [
+                _SESSION_SYNCHRONIZER_JS_TEMPLATE.replace(
+                    "__CLERK_STATE__", ClerkState.get_full_name()
+                )
+            ]
+        return ClerkSessionSynchronizer._custom_code
 
 
 InitialState = dict[str, Any]
@@ -530,11 +804,50 @@ class ClerkProvider(ClerkBase):
         return []
 
 
-def on_load(on_load_events: EventType[()] | None) -> list[IndividualEventType[()]]:
+def _check_takes_auth_state_args(event: Any) -> None:
+    """Check that the event can take `auth_checked` and `is_signed_in` as its last two arguments.
+
+    Reflex drops any extra arguments an event handler doesn't declare, so without this check the
+    handler would silently run without the auth state.
+    """
+    if isinstance(event, rx.EventHandler):
+        fn, n_bound_args = event.fn, 0
+    elif isinstance(event, EventSpec):
+        fn, n_bound_args = event.handler.fn, len(event.args)
+    else:
+        raise TypeError(
+            f"pass_auth_state=True only supports event handlers and event specs, got {event!r}"
+        )
+    params = inspect.signature(fn).parameters.values()
+    if any(p.kind is inspect.Parameter.VAR_POSITIONAL for p in params):
+        return
+    n_positional = sum(
+        p.kind
+        in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        for p in params
+    )
+    # `self` + the already bound args + `auth_checked` and `is_signed_in`.
+    if n_positional < 1 + n_bound_args + 2:
+        raise TypeError(
+            f"pass_auth_state=True requires {fn.__qualname__} to take `auth_checked` and `is_signed_in` "
+            f"as its last two arguments"
+        )
+
+
+def on_load(
+    on_load_events: EventType[()] | None, pass_auth_state: bool = False
+) -> list[IndividualEventType[()]]:
     """Use this to wrap any on_load events that should happen after Clerk has checked authentication.
 
     Args:
         on_load_events: The events to run after authentication is checked.
+        pass_auth_state: Pass `ClerkState.auth_checked` and `ClerkState.is_signed_in` as the last two arguments
+            of the on_load events (avoids needing `await self.get_state(ClerkState)` in the handlers).
+            Only supported for event handlers and event specs (e.g. `State.handler` or `State.handler("x")`).
+
+    Raises:
+        TypeError: If `pass_auth_state` is set and any of the events is not an event handler or event spec
+            that takes the two extra arguments.
 
     Examples:
         app.add_page(..., on_load=clerk.on_load(<events>))
@@ -544,14 +857,52 @@ def on_load(on_load_events: EventType[()] | None) -> list[IndividualEventType[()
     on_load_list = (
         on_load_events if isinstance(on_load_events, list) else [on_load_events]
     )
+    if pass_auth_state:
+        for event in on_load_list:
+            _check_takes_auth_state_args(event)
 
     # Add the on_load events to a registry in the ClerkState instead of actually passing them to on_load.
     #  Then, the wait_for_auth_check event will return the on_load events once auth_checked is True.
     #  Can't just use a blocking wait_for_auth_check because we are really waiting for the frontend event trigger to run,
     #  so we need to not block that while we wait.
-    uid = uuid.uuid4()
+    uid = next(ClerkState._on_load_uids)
     ClerkState._set_on_load_events(uid, on_load_list)
-    return [ClerkState.wait_for_auth_check(uid)]
+    return [ClerkState.wait_for_auth_check(uid, pass_auth_state)]
+
+
+def on_load_batched(*handlers: EventCallback) -> list[IndividualEventType[()]]:
+    """Like `on_load`, but runs all the handlers as a single batch once Clerk has checked authentication.
+
+    The handlers are run within one state lock, and all of their state changes are sent to the frontend
+    as a single update (instead of one event round-trip per handler).
+
+    Note: Only (non-background) event handlers without arguments are supported.
+
+    The handlers run one after another in the given order (not concurrently), so later handlers see the state
+    changes of earlier ones. They all run under the same state lock, and `get_state` is not safe to call
+    concurrently within it.
+
+    Args:
+        handlers: The event handlers to run after authentication is checked.
+
+    Raises:
+        TypeError: If any of the handlers is not a non-background event handler without arguments.
+
+    Examples:
+        app.add_page(..., on_load=clerk.on_load_batched(State.handler_a, State.handler_b))
+    """
+    for handler in handlers:
+        if (
+            not isinstance(handler, rx.EventHandler)
+            or handler.is_background
+            or len(inspect.signature(handler.fn).parameters) > 1
+        ):
+            raise TypeError(
+                f"on_load_batched only supports non-background event handlers without arguments, got {handler!r}"
+            )
+    uid = next(ClerkState._on_load_uids)
+    ClerkState._set_on_load_events(uid, list(handlers))
+    return [ClerkState.run_on_load_batch(uid)]
 
 
 T = TypeVar("T", bound=rx.State)
@@ -564,6 +915,9 @@ async def _get_state_within_handler(
 
     Note: Need to be in `async with self` block if called from background event.
     """
+    if isinstance(current_state, desired_state):
+        # E.g. `get_user` called from a ClerkState handler, no need to look it up in the state tree.
+        return current_state
     try:
         state = await current_state.get_state(desired_state)
     except ImmutableStateError:
@@ -572,7 +926,7 @@ async def _get_state_within_handler(
     return state
 
 
-async def get_user(current_state: rx.State) -> clerk_backend_api.models.User:
+async def get_user(current_state: rx.State) -> "clerk_backend_api.models.User":
     """Get the User object from Clerk given the currently logged in user.
 
     Note: Must be used within an event handler in order to get the appropriate clerk_state.
@@ -632,8 +986,9 @@ def clerk_provider(
     if secret_key:
         ClerkState._set_secret_key(secret_key)
 
-    if register_user_state:
+    if register_user_state and not ClerkUser._is_registered:
         register_on_auth_change_handler(ClerkUser.load_user)
+        ClerkUser._is_registered = True
 
     return ClerkProvider.create(
         ClerkSessionSynchronizer.create(*children),
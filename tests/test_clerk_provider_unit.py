@@ -41,6 +41,31 @@ def test_set_clerk_session_expired_token_clears(monkeypatch):
     assert result == ClerkState.clear_clerk_session
 
 
+def test_set_clerk_session_decode_error_clears(monkeypatch):
+    """A token that can't be decoded clears the session (and requests fresh JWKs) instead of raising."""
+    import importlib
+
+    clerk_provider_module = importlib.import_module("reflex_clerk_api.clerk_provider")
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    state = ClerkState(_reflex_internal_init=True)
+
+    async def fake_get_jwk_keys(self):
+        return {}
+
+    monkeypatch.setattr(ClerkState, "_get_jwk_keys", fake_get_jwk_keys, raising=True)
+    monkeypatch.setattr(ClerkState, "_last_jwk_reset", float("-inf"))
+
+    def fake_decode(*args, **kwargs):
+        raise jose_errors.DecodeError("bad token")
+
+    monkeypatch.setattr(clerk_provider_module.jwt, "decode", fake_decode, raising=True)
+
+    result = asyncio.run(ClerkState.set_clerk_session.fn(state, token="fake"))
+    assert result == ClerkState.clear_clerk_session
+    assert ClerkState._last_jwk_reset > float("-inf")
+
+
 def test_clerk_session_synchronizer_js_contains_reconnect_safe_deps_and_skipcache():
     """String-based regression test for the generated JS."""
     from reflex_clerk_api.clerk_provider import ClerkSessionSynchronizer
@@ -48,3 +73,618 @@ def test_clerk_session_synchronizer_js_contains_reconnect_safe_deps_and_skipcach
     js = ClerkSessionSynchronizer.create().add_custom_code()[0]
     assert "[isLoaded, isSignedIn, addEvents, getToken]" in js
     assert "skipCache: true" in js
+
+
+def _allow_async_with_self(monkeypatch, state_cls):
+    """Let a plain state instance stand in for the background task's StateProxy in `async with self`."""
+
+    async def aenter(self):
+        return self
+
+    async def aexit(self, *exc_info):
+        pass
+
+    monkeypatch.setattr(state_cls, "__aenter__", aenter)
+    monkeypatch.setattr(state_cls, "__aexit__", aexit)
+
+
+def test_wait_for_auth_check_can_pass_auth_state_to_on_load_events(monkeypatch):
+    """on_load events can receive auth_checked/is_signed_in as args instead of using get_state."""
+    from collections import OrderedDict
+
+    import reflex as rx
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    _allow_async_with_self(monkeypatch, ClerkState)
+    monkeypatch.setattr(ClerkState, "_on_load_events", OrderedDict())
+
+    class OnLoadState(rx.State):
+        @rx.event
+        def handle_load(self, auth_checked: bool, is_signed_in: bool) -> None:
+            pass
+
+    uid = next(ClerkState._on_load_uids)
+    ClerkState._set_on_load_events(uid, [OnLoadState.handle_load])
+    state = ClerkState(_reflex_internal_init=True)
+    state.auth_checked = True
+    state.is_signed_in = True
+
+    result = asyncio.run(
+        ClerkState.wait_for_auth_check.fn(state, uid=uid, pass_auth_state=True)
+    )
+    assert len(result) == 1
+    assert [(str(k), str(v)) for k, v in result[0].args] == [
+        ("auth_checked", "true"),
+        ("is_signed_in", "true"),
+    ]
+
+
+def test_wait_for_auth_check_appends_auth_state_to_bound_event_spec(monkeypatch):
+    """Pre-bound event specs get auth_checked/is_signed_in appended after their own args."""
+    from collections import OrderedDict
+
+    import reflex as rx
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    _allow_async_with_self(monkeypatch, ClerkState)
+    monkeypatch.setattr(ClerkState, "_on_load_events", OrderedDict())
+
+    class OnLoadSpecState(rx.State):
+        @rx.event
+        def handle_load(
+            self, page: str, auth_checked: bool, is_signed_in: bool
+        ) -> None:
+            pass
+
+    uid = next(ClerkState._on_load_uids)
+    ClerkState._set_on_load_events(uid, [OnLoadSpecState.handle_load("home")])
+    state = ClerkState(_reflex_internal_init=True)
+    state.auth_checked = True
+    state.is_signed_in = False
+
+    result = asyncio.run(
+        ClerkState.wait_for_auth_check.fn(state, uid=uid, pass_auth_state=True)
+    )
+    assert len(result) == 1
+    assert [(str(k), str(v)) for k, v in result[0].args] == [
+        ("page", '"home"'),
+        ("auth_checked", "true"),
+        ("is_signed_in", "false"),
+    ]
+
+
+def test_on_load_pass_auth_state_rejects_other_callables():
+    """Events that can't take the auth state args are rejected when registering."""
+    import pytest
+    import reflex_clerk_api as clerk
+
+    with pytest.raises(TypeError):
+        clerk.on_load([lambda: None], pass_auth_state=True)
+
+
+def test_on_load_pass_auth_state_rejects_handlers_without_auth_state_params():
+    """Handlers that don't declare the auth state params would silently drop them, so they are rejected."""
+    import pytest
+    import reflex as rx
+    import reflex_clerk_api as clerk
+
+    class NoAuthParamsState(rx.State):
+        @rx.event
+        def no_params(self) -> None:
+            pass
+
+        @rx.event
+        def one_param(self, page: str) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        clerk.on_load(NoAuthParamsState.no_params, pass_auth_state=True)
+    with pytest.raises(TypeError):
+        clerk.on_load(NoAuthParamsState.one_param, pass_auth_state=True)
+    with pytest.raises(TypeError):
+        clerk.on_load(NoAuthParamsState.one_param("home"), pass_auth_state=True)
+
+
+def test_run_on_load_batch_runs_handlers_and_returns_follow_ups_in_order(monkeypatch):
+    """Sync, async, generator and async generator handlers are all drained, in registration order."""
+    from collections import OrderedDict
+
+    import reflex as rx
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    _allow_async_with_self(monkeypatch, ClerkState)
+    monkeypatch.setattr(ClerkState, "_on_load_events", OrderedDict())
+    calls: list[str] = []
+
+    class BatchState(rx.State):
+        @rx.event
+        def follow_up(self) -> None:
+            pass
+
+        @rx.event
+        def sync_handler(self):
+            calls.append("sync")
+            return [BatchState.follow_up, BatchState.async_handler]
+
+        @rx.event
+        async def async_handler(self):
+            calls.append("async")
+            return BatchState.gen_handler
+
+        @rx.event
+        def gen_handler(self):
+            calls.append("gen")
+            yield BatchState.async_gen_handler
+            yield BatchState.none_handler
+
+        @rx.event
+        async def async_gen_handler(self):
+            calls.append("async_gen")
+            yield BatchState.sync_handler
+
+        @rx.event
+        def none_handler(self) -> None:
+            calls.append("none")
+
+    async def fake_get_state(self, state_cls):
+        return state_cls(_reflex_internal_init=True)
+
+    monkeypatch.setattr(ClerkState, "get_state", fake_get_state)
+
+    uid = next(ClerkState._on_load_uids)
+    ClerkState._set_on_load_events(
+        uid,
+        [
+            BatchState.sync_handler,
+            BatchState.async_handler,
+            BatchState.gen_handler,
+            BatchState.async_gen_handler,
+            BatchState.none_handler,
+        ],
+    )
+    state = ClerkState(_reflex_internal_init=True)
+    state.auth_checked = True
+
+    result = asyncio.run(ClerkState.run_on_load_batch.fn(state, uid=uid))
+    assert calls == ["sync", "async", "gen", "async_gen", "none"]
+    assert result == [
+        BatchState.follow_up,
+        BatchState.async_handler,
+        BatchState.gen_handler,
+        BatchState.async_gen_handler,
+        BatchState.none_handler,
+        BatchState.sync_handler,
+    ]
+
+
+def test_on_load_batched_rejects_unsupported_handlers():
+    """Only non-background event handlers without arguments can be batched."""
+    import pytest
+    import reflex as rx
+    import reflex_clerk_api as clerk
+
+    class UnbatchableState(rx.State):
+        @rx.event(background=True)
+        async def background_handler(self) -> None:
+            pass
+
+        @rx.event
+        def handler_with_arg(self, value: str) -> None:
+            pass
+
+        @rx.event
+        def handler(self) -> None:
+            pass
+
+    for handler in (
+        UnbatchableState.background_handler,
+        UnbatchableState.handler_with_arg,
+        UnbatchableState.handler("x"),  # pyright: ignore[reportCallIssue]
+    ):
+        with pytest.raises(TypeError):
+            clerk.on_load_batched(UnbatchableState.handler, handler)
+
+    assert len(clerk.on_load_batched(UnbatchableState.handler)) == 1
+
+
+def test_set_clerk_session_reuses_validated_token(monkeypatch):
+    """A token that was already validated (and not expired) is not decoded and verified again.
+
+    Re-syncing the same session also writes no vars and skips the dependent handlers.
+    """
+    import importlib
+    import time
+    from collections import OrderedDict
+
+    import reflex as rx
+
+    clerk_provider_module = importlib.import_module("reflex_clerk_api.clerk_provider")
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    _allow_async_with_self(monkeypatch, ClerkState)
+    monkeypatch.setattr(ClerkState, "_validated_tokens", OrderedDict())
+
+    class DependentState(rx.State):
+        @rx.event
+        def reload(self) -> None:
+            pass
+
+    monkeypatch.setattr(ClerkState, "_dependent_handlers", {})
+    ClerkState.register_dependent_handler(DependentState.reload)
+
+    async def fake_get_jwk_keys(self):
+        return {}
+
+    monkeypatch.setattr(ClerkState, "_get_jwk_keys", fake_get_jwk_keys, raising=True)
+
+    decode_calls: list[str] = []
+
+    class FakeClaims(dict):
+        def validate(self, leeway=None):
+            pass
+
+    def fake_decode(token, *args, **kwargs):
+        decode_calls.append(token)
+        return FakeClaims(sub="user_1", exp=time.time() + 60)
+
+    monkeypatch.setattr(clerk_provider_module.jwt, "decode", fake_decode, raising=True)
+
+    state = ClerkState(_reflex_internal_init=True)
+    result = asyncio.run(ClerkState.set_clerk_session.fn(state, token="token_a"))
+    assert result == [DependentState.reload]
+    state.dirty_vars.clear()
+    result = asyncio.run(ClerkState.set_clerk_session.fn(state, token="token_a"))
+    assert decode_calls == ["token_a"]
+    assert state.user_id == "user_1"
+    # Nothing changed, so nothing needs to be sent to the frontend or reloaded again.
+    assert not state.dirty_vars
+    assert result == []
+
+    asyncio.run(ClerkState.set_clerk_session.fn(state, token="token_b"))
+    assert decode_calls == ["token_a", "token_b"]
+
+
+def test_validated_token_cache_uses_validation_leeway(monkeypatch):
+    """Cached tokens expire with the same leeway as validation, and changing the leeway drops them."""
+    import time
+    from collections import OrderedDict
+
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    monkeypatch.setattr(ClerkState, "_validated_tokens", OrderedDict())
+    monkeypatch.setattr(ClerkState, "_jwt_validate_leeway_seconds", 60)
+    now = time.time()
+    # Past exp, but still within the leeway (so it would pass validation again).
+    ClerkState._cache_validated_claims(b"in_leeway", {"exp": now - 30})
+    ClerkState._cache_validated_claims(b"expired", {"exp": now - 90})
+    assert ClerkState._get_validated_claims(b"in_leeway") is not None
+    assert ClerkState._get_validated_claims(b"expired") is None
+
+    ClerkState.set_jwt_validate_leeway_seconds(0)
+    assert not ClerkState._validated_tokens
+
+
+def test_get_jwk_keys_fetches_once_for_concurrent_sessions(monkeypatch):
+    """Concurrent sessions needing the JWKs share a single fetch."""
+    from authlib.jose import JsonWebKey
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    monkeypatch.setattr(ClerkState, "_jwk_keys", None)
+    # Fresh lock, since a lock that had to wait is bound to that (test) event loop.
+    monkeypatch.setattr(ClerkState, "_jwk_keys_lock", asyncio.Lock())
+    fetches: list[int] = []
+
+    public_key = JsonWebKey.generate_key("RSA", 2048, is_private=True).as_dict(
+        is_private=False, kid="a"
+    )
+    monkeypatch.setattr(
+        ClerkState, "_client", _fake_jwks_client([public_key], fetches, delay=0.01)
+    )
+
+    async def fetch_concurrently():
+        states = [ClerkState(_reflex_internal_init=True) for _ in range(5)]
+        return await asyncio.gather(*(state._get_jwk_keys() for state in states))
+
+    results = asyncio.run(fetch_concurrently())
+    assert fetches == [1]
+    # Imported once into a KeySet shared by every session.
+    assert all(keys is results[0] for keys in results)
+    assert results[0].find_by_kid("a").as_dict() == public_key
+
+
+def test_wait_for_auth_check_wakes_up_when_auth_is_checked(monkeypatch):
+    """Waiting on_load events run as soon as the auth check completes (not after the timeout)."""
+    import time
+    from collections import OrderedDict
+
+    import reflex as rx
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    _allow_async_with_self(monkeypatch, ClerkState)
+    monkeypatch.setattr(ClerkState, "_on_load_events", OrderedDict())
+    monkeypatch.setattr(ClerkState, "_auth_wait_timeout_seconds", 5.0)
+
+    class WakeUpState(rx.State):
+        @rx.event
+        def handle_load(self) -> None:
+            pass
+
+    uid = next(ClerkState._on_load_uids)
+    ClerkState._set_on_load_events(uid, [WakeUpState.handle_load])
+    state = ClerkState(_reflex_internal_init=True)
+
+    async def wait_and_sign_out():
+        waiter = asyncio.create_task(ClerkState.wait_for_auth_check.fn(state, uid=uid))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        ClerkState.clear_clerk_session.fn(state)
+        return await waiter
+
+    start = time.monotonic()
+    result = asyncio.run(wait_and_sign_out())
+    assert time.monotonic() - start < 1.0
+    assert result == [WakeUpState.handle_load]
+    assert not ClerkState._auth_checked_events
+
+
+def test_auth_check_timeout_keeps_event_for_other_waiters(monkeypatch):
+    """A waiter timing out doesn't drop the event that other waiters of the same client still wait on."""
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    _allow_async_with_self(monkeypatch, ClerkState)
+    monkeypatch.setattr(ClerkState, "_auth_checked_events", {})
+    monkeypatch.setattr(ClerkState, "_auth_checked_waiters", {})
+    monkeypatch.setattr(ClerkState, "_auth_wait_timeout_seconds", 0.3)
+    state = ClerkState(_reflex_internal_init=True)
+
+    async def first_times_out_then_sign_out():
+        first = asyncio.create_task(state._wait_until_auth_checked())
+        await asyncio.sleep(0.2)
+        second = asyncio.create_task(state._wait_until_auth_checked())
+        assert await first == (False, False)
+        assert not second.done()
+        ClerkState.clear_clerk_session.fn(state)
+        # Woken up straight away, rather than after its own timeout.
+        return await asyncio.wait_for(second, 0.1)
+
+    assert asyncio.run(first_times_out_then_sign_out()) == (True, False)
+    assert not ClerkState._auth_checked_events
+    assert not ClerkState._auth_checked_waiters
+
+
+def test_set_clerk_session_verifies_token_with_jwk_key_set(monkeypatch):
+    """A real RS256 token is verified against the imported JWK key set."""
+    import time
+    from collections import OrderedDict
+
+    from authlib.jose import JsonWebKey, jwt
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    _allow_async_with_self(monkeypatch, ClerkState)
+    monkeypatch.setattr(ClerkState, "_validated_tokens", OrderedDict())
+    private_key = JsonWebKey.generate_key("RSA", 2048, is_private=True)
+    public_key = private_key.as_dict(is_private=False, kid="key_1")
+    monkeypatch.setattr(
+        ClerkState, "_jwk_keys", JsonWebKey.import_key_set({"keys": [public_key]})
+    )
+    monkeypatch.setattr(ClerkState, "_jwk_keys_fetched_at", time.monotonic())
+    now = int(time.time())
+    token = jwt.encode(
+        {"alg": "RS256", "kid": "key_1"},
+        {"sub": "user_2", "exp": now + 60, "nbf": now - 5},
+        private_key,
+    ).decode()
+
+    state = ClerkState(_reflex_internal_init=True)
+    asyncio.run(ClerkState.set_clerk_session.fn(state, token=token))
+    assert state.is_signed_in
+    assert state.user_id == "user_2"
+
+
+def _fake_jwks_client(
+    public_keys: list[dict],
+    fetches: list[int],
+    error: Exception | None = None,
+    delay: float = 0.0,
+):
+    class FakeJwks:
+        keys = public_keys
+
+        def model_dump(self):
+            return {"keys": self.keys}
+
+    class FakeJwksApi:
+        async def get_jwks_async(self):
+            fetches.append(1)
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+            return FakeJwks()
+
+    class FakeClient:
+        jwks = FakeJwksApi()
+
+    return FakeClient()
+
+
+def test_set_clerk_session_refetches_jwk_keys_for_unknown_kid(monkeypatch):
+    """A token signed with a key that isn't cached yet (e.g. after key rotation) re-fetches the keys."""
+    import time
+    from collections import OrderedDict
+
+    from authlib.jose import JsonWebKey, jwt
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    _allow_async_with_self(monkeypatch, ClerkState)
+    monkeypatch.setattr(ClerkState, "_validated_tokens", OrderedDict())
+    monkeypatch.setattr(ClerkState, "_jwk_keys_lock", asyncio.Lock())
+    monkeypatch.setattr(ClerkState, "_last_jwk_reset", float("-inf"))
+    old_key = JsonWebKey.generate_key("RSA", 2048, is_private=True)
+    new_key = JsonWebKey.generate_key("RSA", 2048, is_private=True)
+    old_public_key = old_key.as_dict(is_private=False, kid="old")
+    new_public_key = new_key.as_dict(is_private=False, kid="new")
+    monkeypatch.setattr(
+        ClerkState, "_jwk_keys", JsonWebKey.import_key_set({"keys": [old_public_key]})
+    )
+    monkeypatch.setattr(ClerkState, "_jwk_keys_fetched_at", time.monotonic())
+    fetches: list[int] = []
+    monkeypatch.setattr(
+        ClerkState,
+        "_client",
+        _fake_jwks_client([old_public_key, new_public_key], fetches),
+    )
+    now = int(time.time())
+    token = jwt.encode(
+        {"alg": "RS256", "kid": "new"},
+        {"sub": "user_3", "exp": now + 60, "nbf": now - 5},
+        new_key,
+    ).decode()
+
+    state = ClerkState(_reflex_internal_init=True)
+    asyncio.run(ClerkState.set_clerk_session.fn(state, token=token))
+    assert fetches == [1]
+    assert state.user_id == "user_3"
+
+
+def test_get_jwk_keys_refreshes_old_keys_in_background(monkeypatch):
+    """Keys older than the max age are still returned, while fresh keys are fetched in the background."""
+    import time
+
+    from authlib.jose import JsonWebKey
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    monkeypatch.setattr(ClerkState, "_jwk_keys_lock", asyncio.Lock())
+    monkeypatch.setattr(ClerkState, "_jwk_refresh_task", None)
+    public_key = JsonWebKey.generate_key("RSA", 2048, is_private=True).as_dict(
+        is_private=False, kid="a"
+    )
+    old_keys = JsonWebKey.import_key_set({"keys": [public_key]})
+    monkeypatch.setattr(ClerkState, "_jwk_keys", old_keys)
+    monkeypatch.setattr(
+        ClerkState,
+        "_jwk_keys_fetched_at",
+        time.monotonic() - ClerkState._jwk_keys_max_age_seconds - 1,
+    )
+    fetches: list[int] = []
+    monkeypatch.setattr(ClerkState, "_client", _fake_jwks_client([public_key], fetches))
+
+    async def get_keys_twice():
+        state = ClerkState(_reflex_internal_init=True)
+        first = await state._get_jwk_keys()
+        second = await state._get_jwk_keys()
+        assert ClerkState._jwk_refresh_task is not None
+        await ClerkState._jwk_refresh_task
+        return first, second
+
+    first, second = asyncio.run(get_keys_twice())
+    assert first is old_keys and second is old_keys
+    assert fetches == [1]
+    assert ClerkState._jwk_keys is not old_keys
+
+
+def test_get_jwk_keys_backs_off_after_failed_refresh(monkeypatch):
+    """A failed background refresh keeps the old keys and isn't retried on every token straight away."""
+    import time
+
+    from authlib.jose import JsonWebKey
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    monkeypatch.setattr(ClerkState, "_jwk_keys_lock", asyncio.Lock())
+    monkeypatch.setattr(ClerkState, "_jwk_refresh_task", None)
+    monkeypatch.setattr(ClerkState, "_jwk_refresh_retry_at", float("-inf"))
+    public_key = JsonWebKey.generate_key("RSA", 2048, is_private=True).as_dict(
+        is_private=False, kid="a"
+    )
+    old_keys = JsonWebKey.import_key_set({"keys": [public_key]})
+    monkeypatch.setattr(ClerkState, "_jwk_keys", old_keys)
+    monkeypatch.setattr(
+        ClerkState,
+        "_jwk_keys_fetched_at",
+        time.monotonic() - ClerkState._jwk_keys_max_age_seconds - 1,
+    )
+    fetches: list[int] = []
+    monkeypatch.setattr(
+        ClerkState,
+        "_client",
+        _fake_jwks_client([public_key], fetches, error=ConnectionError("down")),
+    )
+
+    async def get_keys_after_failed_refresh():
+        state = ClerkState(_reflex_internal_init=True)
+        await state._get_jwk_keys()
+        assert ClerkState._jwk_refresh_task is not None
+        await ClerkState._jwk_refresh_task
+        return [await state._get_jwk_keys() for _ in range(3)]
+
+    results = asyncio.run(get_keys_after_failed_refresh())
+    assert all(keys is old_keys for keys in results)
+    assert fetches == [1]
+
+    # Once the retry interval has passed, the next token tries again.
+    monkeypatch.setattr(ClerkState, "_jwk_refresh_retry_at", float("-inf"))
+    asyncio.run(get_keys_after_failed_refresh())
+    assert fetches == [1, 1]
+
+
+def test_set_clerk_session_rejects_untrusted_tokens(monkeypatch):
+    """Tokens with a bad signature, a non-RS256 alg or a future nbf clear the session instead of raising."""
+    import base64
+    import json
+    import time
+
+    from authlib.jose import JsonWebKey, jwt
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    _allow_async_with_self(monkeypatch, ClerkState)
+    private_key = JsonWebKey.generate_key("RSA", 2048, is_private=True)
+    other_key = JsonWebKey.generate_key("RSA", 2048, is_private=True)
+    public_key = private_key.as_dict(is_private=False, kid="key_1")
+    monkeypatch.setattr(
+        ClerkState, "_jwk_keys", JsonWebKey.import_key_set({"keys": [public_key]})
+    )
+    monkeypatch.setattr(ClerkState, "_jwk_keys_fetched_at", time.monotonic())
+    now = int(time.time())
+    claims = {"sub": "user_4", "exp": now + 60, "nbf": now - 5}
+
+    def b64(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    tokens = [
+        # Signed with a different key than the one published for the kid
+        jwt.encode({"alg": "RS256", "kid": "key_1"}, claims, other_key).decode(),
+        # Unsigned
+        f"{b64({'alg': 'none', 'kid': 'key_1'})}.{b64(claims)}.",
+        # Not valid yet
+        jwt.encode(
+            {"alg": "RS256", "kid": "key_1"},
+            {**claims, "nbf": now + 3600},
+            private_key,
+        ).decode(),
+    ]
+    for token in tokens:
+        state = ClerkState(_reflex_internal_init=True)
+        result = asyncio.run(ClerkState.set_clerk_session.fn(state, token=token))
+        assert result == ClerkState.clear_clerk_session
+        assert not state.is_signed_in
+
+
+def test_on_load_registry_is_bounded_and_keeps_recently_used_pages(monkeypatch):
+    """Registrations are not popped when used (every page visit shares them), but the registry is capped."""
+    from collections import OrderedDict
+
+    import reflex as rx
+    from reflex.event import EventType
+    from reflex_clerk_api.clerk_provider import ClerkState
+
+    monkeypatch.setattr(ClerkState, "_on_load_events", OrderedDict())
+    monkeypatch.setattr(ClerkState, "_on_load_events_max_size", 2)
+    uid_a, uid_b, uid_c = (next(ClerkState._on_load_uids) for _ in range(3))
+    events_a: EventType[()] = [rx.console_log("a")]
+
+    ClerkState._set_on_load_events(uid_a, events_a)
+    ClerkState._set_on_load_events(uid_b, [rx.console_log("b")])
+    assert ClerkState._get_on_load_events(uid_a) is events_a
+    assert ClerkState._get_on_load_events(uid_a) is events_a
+    ClerkState._set_on_load_events(uid_c, [rx.console_log("c")])
+
+    assert list(ClerkState._on_load_events) == [uid_a, uid_c]
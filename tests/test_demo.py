@@ -20,6 +20,15 @@ PAGE_LOAD_TIMEOUT = 10000 if not os.getenv("CI") else 30000
 INTERACTION_TIMEOUT = 2000 if not os.getenv("CI") else 20000
 
 
+def debug_pause(page: Page) -> None:
+    """Pause in the Playwright inspector, but only when debugging (`PWDEBUG=1`).
+
+    Otherwise each pause is still a round-trip to the Playwright driver.
+    """
+    if os.getenv("PWDEBUG"):
+        page.pause()
+
+
 @pytest.fixture(scope="session")
 def demo_app():
     app_root = Path(__file__).parent.parent / "clerk_api_demo"
@@ -42,7 +51,7 @@ def page(
         page.screenshot(path="playwright_test_error.png")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def clerk_client() -> Iterator[Clerk]:
     """Create clerk backend api client."""
     secret_key = os.environ["CLERK_SECRET_KEY"]
@@ -58,11 +67,11 @@ def test_clerk_client(clerk_client: Clerk):
     assert existing is not None
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def create_test_user(clerk_client: Clerk) -> User:
     """Creates (or checks already exists) a test clerk user.
 
-    This can then be used to sign in during tests.
+    This can then be used to sign in during tests. Session scoped, so Clerk is only queried once per test run.
     """
     existing = clerk_client.users.list(request={"email_address": [TEST_EMAIL]})
     if existing is not None and len(existing) > 0:
@@ -120,7 +129,7 @@ def test_render(page: Page):
 
     I.e. Check components are visible.
     """
-    page.pause()
+    debug_pause(page)
     expect(page.locator('[id="__next"]')).to_contain_text("reflex-clerk-api demo")
     expect(page.locator('[id="__next"]')).to_contain_text("Getting Started")
     expect(page.locator('[id="__next"]')).to_contain_text("Demos")
@@ -139,7 +148,7 @@ def test_sign_up(page: Page):
 
     Note: Can't actually test signing up in headless mode because of bot detection.
     """
-    page.pause()
+    debug_pause(page)
     page.get_by_role("button", name="Sign up").click()
     expect(page.get_by_role("heading")).to_contain_text("Create your account")
 
@@ -159,14 +168,14 @@ def test_sign_in(page: Page):
     expect(page.get_by_role("heading")).to_contain_text("Sign in to")
     page.get_by_role("textbox", name="Email address").click()
     page.get_by_role("textbox", name="Email address").fill(TEST_EMAIL)
-    page.pause()
+    debug_pause(page)
     page.get_by_role("button", name="Continue", exact=True).click()
     page.get_by_role("textbox", name="Password").click()
     page.get_by_role("textbox", name="Password").fill(TEST_PASSWORD)
     page.get_by_role("button", name="Continue", exact=True).click()
     expect(page.get_by_test_id("sign_out")).not_to_be_visible()
 
-    page.pause()
+    debug_pause(page)
 
 
 @pytest.fixture
@@ -200,14 +209,14 @@ def test_signed_in_state(page: Page, sign_in: User):
     """Check a signed-in user sees expected state of app."""
     assert sign_in.id is not None
     page.get_by_test_id("clerkstate_variables_and_methods").hover()
-    page.pause()
+    debug_pause(page)
     expect(page.get_by_test_id("is_hydrated")).to_contain_text("true")
     expect(page.get_by_test_id("auth_checked")).to_contain_text("true")
     expect(page.get_by_test_id("is_signed_in")).to_contain_text("true")
     expect(page.get_by_test_id("user_id")).to_contain_text(sign_in.id)
 
     page.get_by_test_id("clerk_loaded_and_signed_in_out_areas").hover()
-    page.pause()
+    debug_pause(page)
     expect(page.get_by_test_id("you_are_signed_in")).to_contain_text(
         "You are signed in."
     )
@@ -215,7 +224,7 @@ def test_signed_in_state(page: Page, sign_in: User):
     expect(page.get_by_test_id("you_are_signed_out")).not_to_be_visible()
 
     page.get_by_test_id("better_on_load_handling").hover()
-    page.pause()
+    debug_pause(page)
     expect(page.get_by_test_id("info_from_load")).to_contain_text(
         "clerkstate.auth_checked: True"
     )